@@ -0,0 +1,30 @@
+"""
+AEP CMB numerical kernels
+Vectorized NumPy helpers for the CMB analysis pipeline, as free
+functions over ndarrays; AEPCMBAnalysis only orchestrates them
+"""
+
+import numpy as np
+
+
+# Stepwise kernels behind AEPCMBAnalysis.normal_distribution and
+# simulate_cmb_data. Whole-array expressions, so there are no Python
+# loops to compile; callers pass noise levels and f_NL already cast to
+# the map dtype, and the kernels keep that dtype.
+
+def normal_distribution(rng, mean, std, size):
+    """Draw `size` normal samples from a NumPy Generator (Ziggurat)"""
+    return rng.standard_normal(size) * std + mean
+
+
+def synth_non_gaussian(cmb_base, f_nl):
+    """Add the AEP non-Gaussian component (simplified χ² field)"""
+    one = cmb_base.dtype.type(1.0)
+    return cmb_base + f_nl * (cmb_base * cmb_base - one)
+
+
+def synth_multi_freq(noise, noise_levels, cmb_with_ng):
+    """Scale unit noise per frequency and add the sky, in place"""
+    noise *= noise_levels[:, np.newaxis]
+    noise += cmb_with_ng
+    return noise
@@ -0,0 +1,42 @@
+import pytest
+
+from cmb_analysis import AEPCMBAnalysis, BinOption
+
+
+@pytest.fixture
+def analysis():
+    return AEPCMBAnalysis(n_pixels=1000)
+
+
+def test_optimize_returns_original_dict(analysis):
+    options = [
+        {'n_bins': 10, 'complexity': 5, 'n_modes': 100},
+        {'n_bins': 20, 'complexity': 8, 'n_modes': 400},
+        {'n_bins': 30, 'complexity': 12, 'n_modes': 900, 'label': 'fine'},
+    ]
+    best = analysis.aep_optimize_parameters(options)
+    assert best is options[2]
+    assert best['n_bins'] == 30
+
+
+def test_optimize_accepts_records(analysis):
+    options = [
+        BinOption(n_bins=10, complexity=5, n_modes=100),
+        BinOption(n_bins=20, complexity=8, n_modes=400, n_parameters=3),
+    ]
+    assert analysis.aep_optimize_parameters(iter(options)) is options[0]
+
+
+def test_optimize_empty_returns_none(analysis):
+    assert analysis.aep_optimize_parameters([]) is None
+
+
+@pytest.mark.parametrize('option', [
+    {'n_bins': 1, 'n_modes': 0},
+    {'n_bins': 1, 'n_modes': -4},
+    {'n_bins': 1, 'n_modes': 100, 'n_parameters': 0},
+    BinOption(n_bins=1, n_modes=100, n_parameters=-2),
+])
+def test_optimize_rejects_non_positive_logs(analysis, option):
+    with pytest.raises(ValueError):
+        analysis.aep_optimize_parameters([{'n_bins': 10, 'n_modes': 100}, option])
@@ -1,17 +1,10 @@
-import os
+from pathlib import Path
 
-# Define the nested directory structure
-structure = [
-    "cosmological",
-    "cosmological/neuroscientific", 
-    "cosmological/neuroscientific/fundamental_physics",
-    "cosmological/neuroscientific/fundamental_physics/statistical",
-    "cosmological/neuroscientific/fundamental_physics/statistical/containers"
-]
+# Deepest path of the nested directory structure; its parents
+# (cosmological/, .../neuroscientific/, ...) are created along the way
+structure = Path("cosmological/neuroscientific/fundamental_physics/statistical/containers")
 
 # Create directories
-for directory in structure:
-    os.makedirs(directory, exist_ok=True)
-    print(f"Created: {directory}")
+structure.mkdir(parents=True, exist_ok=True)
 
-print("Directory structure created successfully!")
+print(f"Directory structure created successfully: {structure}")